@@ -1,9 +1,10 @@
 import pygame
+import numpy as np
 import random
 import sys
 import math
+from array import array
 from typing import List, Tuple
-from dataclasses import dataclass
 from enum import Enum, auto
 
 # --- 1. CONFIGURATION ---
@@ -29,6 +30,25 @@ BASE_SCROLL_SPEED = 5
 BASE_CLOUD_FREQ = 160 
 POWERUP_FREQUENCY = 600 # 10 seconds
 TARGET_NUMBER = 50
+NUM_STARS = 120
+CLOUD_WIDTH, CLOUD_HEIGHT = 180, 120
+CLOUD_AMPLITUDE = 40 # How far clouds bob up/down (pixels)
+CLOUD_CAPACITY = 32 # Initial size of the cloud arrays, grown when full
+STAR_POOL_SIZE = 4096 # Pre-sampled heights for wrapping stars (must be >= NUM_STARS)
+
+# Trig Lookup Table
+SIN_TABLE_SIZE = 4096 # Must be a power of two
+_SIN_TABLE = array('d', [math.sin(i * 2 * math.pi / SIN_TABLE_SIZE) for i in range(SIN_TABLE_SIZE)])
+_SIN_TABLE_SCALE = SIN_TABLE_SIZE / (2 * math.pi)
+_DEG2RAD = math.pi / 180.0
+
+def fast_sin(x: float) -> float:
+    """ Table based sin(x), accurate enough for animation """
+    return _SIN_TABLE[int(x * _SIN_TABLE_SCALE) & (SIN_TABLE_SIZE - 1)]
+
+def fast_cos(x: float) -> float:
+    """ Table based cos(x), a quarter turn ahead of fast_sin """
+    return _SIN_TABLE[(int(x * _SIN_TABLE_SCALE) + SIN_TABLE_SIZE // 4) & (SIN_TABLE_SIZE - 1)]
 
 # --- 2. MODELS & ENUMS ---
 
@@ -44,6 +64,13 @@ class Operation(Enum):
     MULTIPLY = "x"
     DIVIDE = ":"
 
+OPERATION_FUNCS = {
+    Operation.ADD: lambda s, v: s + v,
+    Operation.SUBTRACT: lambda s, v: s - v,
+    Operation.MULTIPLY: lambda s, v: s * v,
+    Operation.DIVIDE: lambda s, v: s / v if v != 0 else s, # Dividing by 0 leaves the score alone
+}
+
 class PowerUpType(Enum):
     SLOW_MOTION = "SLOW"
     ROUND_NUM = "FIX" 
@@ -51,14 +78,19 @@ class PowerUpType(Enum):
     INVERT_CONTROLS = "CONFUSION" 
     RAPID_FIRE = "RAPID"
 
-@dataclass
-class Star:
-    x: float
-    y: float
-    size: float
-    speed: float
+def _hue_color(hue: int) -> Tuple[int, int, int]:
+    c = pygame.Color(0, 0, 0)
+    c.hsva = (hue, 100, 100, 100)
+    return (c.r, c.g, c.b)
 
 class PowerUp:
+    # Rainbow colors for the confusion star, one per 5 degree hue step
+    _HUE_CYCLE = [_hue_color(h) for h in range(0, 360, 5)]
+
+    # The 10 star points (every 36 degrees, alternating radius) at angle 0, rotated in draw()
+    _BASE_POINTS = [((20 if i % 2 == 0 else 10) * math.cos(math.radians(i * 36)),
+                     (20 if i % 2 == 0 else 10) * math.sin(math.radians(i * 36))) for i in range(10)]
+
     def __init__(self, x: int, y: int, p_type: PowerUpType):
         self.rect = pygame.Rect(x, y, 40, 40)
         self.type = p_type
@@ -80,67 +112,53 @@ class PowerUp:
         center = self.rect.center
         draw_color = self.color
         if self.type == PowerUpType.INVERT_CONTROLS:
-            c = pygame.Color(0,0,0)
-            c.hsva = (self.hue, 100, 100, 100)
-            draw_color = c
-
-        points = []
-        for i in range(10):
-            radius = 20 if i % 2 == 0 else 10
-            angle_rad = math.radians(self.angle + i * 36)
-            px = center[0] + radius * math.cos(angle_rad)
-            py = center[1] + radius * math.sin(angle_rad)
-            points.append((px, py))
+            draw_color = self._HUE_CYCLE[self.hue // 5]
+
+        angle_rad = self.angle * _DEG2RAD
+        c, s = fast_cos(angle_rad), fast_sin(angle_rad)
+        cx, cy = center
+        points = [(cx + px * c - py * s, cy + px * s + py * c) for px, py in self._BASE_POINTS]
         
         pygame.draw.polygon(surface, draw_color, points)
         pygame.draw.polygon(surface, (255, 255, 255), points, 2) 
 
+# Appearance and value of a cloud; its position lives in the game's cloud arrays
 class Cloud:
-    def __init__(self, x: int, y: int, width: int, height: int, op: Operation, val: int):
-        self.rect = pygame.Rect(x, y, width, height)
+    PUFF_PADDING = 50 # Largest puff radius
+
+    def __init__(self, width: int, height: int, op: Operation, val: int,
+                 labels: Tuple[pygame.Surface, pygame.Surface, pygame.Surface, Tuple[int, int]]):
         self.op = op
         self.val = val
-        
-        # MOVEMENT LOGIC
-        self.original_y = float(y) # Remember starting lane
-        self.float_offset = random.uniform(0, 2 * math.pi) # Random start point in sine wave
-        self.float_speed = random.uniform(0.02, 0.05) # How fast it bobs
-        self.amplitude = 40 # How far up/down it goes (pixels)
+        self.half_width, self.half_height = width // 2, height // 2
+        self.labels = labels # (shadow, normal, ghost, centering offset), see SpaceMathGame.get_cloud_labels
 
         self.circles = []
         for _ in range(8):
-            cx = random.randint(x, x + width)
-            cy = random.randint(y, y + height)
+            cx = random.randint(0, width)
+            cy = random.randint(0, height)
             r = random.randint(30, 50)
-            self.circles.append((cx - x, cy - y, r))
+            self.circles.append((cx, cy, r))
 
-    def move(self, scroll_speed: float):
-        # 1. Horizontal Scroll
-        self.rect.x -= scroll_speed
-        
-        # 2. Vertical Sine Wave (Bobbing)
-        # Using pygame.time.get_ticks() ensures smooth animation
-        current_time = pygame.time.get_ticks()
-        
-        # Calculate vertical offset
-        wave = math.sin(current_time * 0.002 + self.float_offset) * self.amplitude
-        
-        # Apply to rect
-        self.rect.y = int(self.original_y + wave)
-
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font, is_ghost_active: bool):
-        base_color = (230, 230, 250) if not is_ghost_active else (100, 100, 120)
-        
-        # Draw circles relative to the current rect position
+        # Bake the puffs once; circles can overhang the rect by up to their radius
+        pad = self.PUFF_PADDING
+        self.base_surf_normal = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA).convert_alpha()
+        self.base_surf_ghost = self.base_surf_normal.copy()
         for cx, cy, r in self.circles:
-            pygame.draw.circle(surface, base_color, (self.rect.x + cx, self.rect.y + cy), r)
-        
-        text = f"{self.op.value} {self.val}"
-        shadow = font.render(text, True, (50, 50, 80))
-        surface.blit(shadow, (self.rect.centerx - shadow.get_width()//2 + 2, self.rect.centery - shadow.get_height()//2 + 2))
-        
-        render = font.render(text, True, (50, 100, 150) if not is_ghost_active else (80, 80, 80))
-        surface.blit(render, (self.rect.centerx - render.get_width()//2, self.rect.centery - render.get_height()//2))
+            pygame.draw.circle(self.base_surf_normal, (230, 230, 250), (cx + pad, cy + pad), r)
+            pygame.draw.circle(self.base_surf_ghost, (100, 100, 120), (cx + pad, cy + pad), r)
+
+    def get_blits(self, is_ghost_active: bool, x: int, y: int) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """ Returns the (surface, position) pairs that make up this cloud at (x, y), for Surface.blits """
+        base_surf = self.base_surf_normal if not is_ghost_active else self.base_surf_ghost
+        shadow, render_normal, render_ghost, (ox, oy) = self.labels
+        render = render_normal if not is_ghost_active else render_ghost
+        tx, ty = x + self.half_width + ox, y + self.half_height + oy
+        return [
+            (base_surf, (x - self.PUFF_PADDING, y - self.PUFF_PADDING)),
+            (shadow, (tx + 2, ty + 2)),
+            (render, (tx, ty)),
+        ]
 
 class Player:
     def __init__(self):
@@ -150,13 +168,7 @@ class Player:
 
     def calculate(self, op: Operation, val: int) -> bool:
         """ Returns True if decimal penalty occurred """
-        res = float(self.score)
-        if op == Operation.ADD: res += val
-        elif op == Operation.SUBTRACT: res -= val
-        elif op == Operation.MULTIPLY: res *= val
-        elif op == Operation.DIVIDE:
-            if val == 0: return False
-            res = res / val
+        res = OPERATION_FUNCS[op](float(self.score), val)
         
         if res < 0: res = 0
         
@@ -205,22 +217,67 @@ class SpaceMathGame:
         pygame.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Cosmic Calculator: Mission to Moon")
+        # Only QUIT and KEYDOWN are handled; SDL drops the rest before they reach Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         
         self.font_ui = pygame.font.SysFont("Arial", 28, bold=True)
         self.font_cloud = pygame.font.SysFont("Verdana", 45, bold=True) 
         self.font_big = pygame.font.SysFont("Arial", 60, bold=True)
+
+        # Cloud labels rendered with font_cloud, shared by every cloud
+        self.cloud_labels = {}
+
+        # Pre-rendered star sprites, keyed by radius
+        self.star_sprites = {}
+        for r in range(1, 4):
+            sprite = pygame.Surface((2 * r, 2 * r), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(sprite, (255, 255, 255), (r, r), r)
+            self.star_sprites[r] = sprite
+
+        self.game_over_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.game_over_overlay.fill((0, 0, 0, 180))
+
+        # Static HUD banners, keyed by status
+        self.hud_banners = {
+            key: self.font_ui.render(text, True, color).convert_alpha()
+            for key, text, color in [
+                ("slow", "SLOW MOTION", COLOR_PU_SLOW),
+                ("ghost", "GHOST MODE", COLOR_PU_GHOST),
+                ("inverted", "CONTROLS FLIPPED!", (255, 100, 255)),
+                ("rapid", "RAPID FIRE!!!", COLOR_PU_RAPID),
+                ("penalty", "DECIMAL PENALTY! SPEED UP!", (255, 50, 50)),
+            ]
+        }
         
         self.reset_game()
 
     def reset_game(self):
         self.state = GameState.PLAYING
         self.player = Player()
-        self.clouds: List[Cloud] = []
         self.powerups: List[PowerUp] = []
-        self.stars = [Star(random.randint(0, WIDTH), random.randint(0, HEIGHT), 
-                           random.randint(1, 3), random.uniform(0.5, 2)) for _ in range(120)]
+        # Second buffers for the per-frame survivor filtering
+        self.clouds_spare: List[Cloud] = []
+        self.powerups_spare: List[PowerUp] = []
+
+        # Clouds, stored as parallel arrays; slot i of each array belongs to self.clouds[i]
+        self.clouds: List[Cloud] = []
+        self.n_clouds = 0
+        self.cloud_x = np.empty(CLOUD_CAPACITY, dtype=np.float32)
+        self.cloud_y = np.empty(CLOUD_CAPACITY, dtype=np.float32)
+        self.cloud_orig_y = np.empty(CLOUD_CAPACITY, dtype=np.float32) # Starting lane
+        self.cloud_offset = np.empty(CLOUD_CAPACITY, dtype=np.float32) # Start point in the sine wave
+        # Background stars, stored as parallel arrays
+        self.star_x = np.random.randint(0, WIDTH + 1, NUM_STARS).astype(np.float32)
+        self.star_y = np.random.randint(0, HEIGHT + 1, NUM_STARS).astype(np.float32)
+        self.star_size = np.random.randint(1, 4, NUM_STARS)
+        self.star_speed = np.random.uniform(0.5, 2, NUM_STARS).astype(np.float32)
+        self.star_y_pool = np.random.randint(0, HEIGHT + 1, STAR_POOL_SIZE)
+        self.star_y_cursor = 0
         self.target = TARGET_NUMBER
+        self.moon_surf = self.render_moon()
+        self.stars_bg_surf = None # Rendered on the first landing scene frame
         
         self.spawn_cloud_wall(x_offset=200) 
         self.timer_spawn_cloud = 0
@@ -248,7 +305,62 @@ class SpaceMathGame:
             val = random.randint(1, 9)
             if op == Operation.MULTIPLY: val = random.randint(2, 4)
             y_pos = i * lane_height + (lane_height // 2) - 60
-            self.clouds.append(Cloud(wall_x, y_pos, 180, 120, op, val))
+            self.add_cloud(wall_x, y_pos, Cloud(CLOUD_WIDTH, CLOUD_HEIGHT, op, val, self.get_cloud_labels(op, val)))
+
+    def get_cloud_labels(self, op: Operation, val: int) -> Tuple[pygame.Surface, pygame.Surface, pygame.Surface, Tuple[int, int]]:
+        """ Returns (shadow, normal, ghost, centering offset) for a cloud label, rendered once per (op, val) """
+        key = (op, val)
+        if key not in self.cloud_labels:
+            text = f"{op.value} {val}"
+            shadow = self.font_cloud.render(text, True, (50, 50, 80)).convert_alpha()
+            # All three renders share a size, so one offset centers them all
+            offset = (-(shadow.get_width() // 2), -(shadow.get_height() // 2))
+            self.cloud_labels[key] = (
+                shadow,
+                self.font_cloud.render(text, True, (50, 100, 150)).convert_alpha(),
+                self.font_cloud.render(text, True, (80, 80, 80)).convert_alpha(),
+                offset,
+            )
+        return self.cloud_labels[key]
+
+    def add_cloud(self, x: int, y: int, cloud: Cloud):
+        n = self.n_clouds
+        if n == len(self.cloud_x):
+            self.cloud_x, self.cloud_y, self.cloud_orig_y, self.cloud_offset = (
+                np.concatenate((a, np.empty_like(a)))
+                for a in (self.cloud_x, self.cloud_y, self.cloud_orig_y, self.cloud_offset))
+        self.cloud_x[n] = x
+        self.cloud_y[n] = y
+        self.cloud_orig_y[n] = y
+        self.cloud_offset[n] = random.uniform(0, 2 * math.pi)
+        self.clouds.append(cloud)
+        self.n_clouds = n + 1
+
+    def move_clouds(self, scroll_speed: float, wave_phase: float):
+        n = self.n_clouds
+        # 1. Horizontal Scroll, in whole pixels like Rect (rounds half away from zero)
+        x = self.cloud_x[:n]
+        x -= scroll_speed
+        np.trunc(x + np.copysign(0.5, x), out=x)
+        # 2. Vertical Sine Wave (Bobbing) around each cloud's lane
+        y = self.cloud_y[:n]
+        np.sin(wave_phase + self.cloud_offset[:n], out=y)
+        y *= CLOUD_AMPLITUDE
+        y += self.cloud_orig_y[:n]
+
+    def keep_clouds(self, keep: np.ndarray):
+        """ Compacts the cloud arrays and list down to the slots where `keep` is True """
+        n = self.n_clouds
+        k = np.count_nonzero(keep)
+        for a in (self.cloud_x, self.cloud_y, self.cloud_orig_y, self.cloud_offset):
+            a[:k] = a[:n][keep]
+
+        kept_clouds = self.clouds_spare
+        kept_clouds.clear()
+        for cloud, kept in zip(self.clouds, keep.tolist()):
+            if kept: kept_clouds.append(cloud)
+        self.clouds_spare, self.clouds = self.clouds, kept_clouds
+        self.n_clouds = k
 
     def spawn_powerup(self):
         roll = random.random()
@@ -270,36 +382,81 @@ class SpaceMathGame:
         self.powerups.append(PowerUp(WIDTH + 50, y, p_type))
 
     def update_background(self):
-        for star in self.stars:
-            star.x -= star.speed
-            if star.x < 0:
-                star.x = WIDTH
-                star.y = random.randint(0, HEIGHT)
-            pygame.draw.circle(self.screen, (255, 255, 255), (int(star.x), int(star.y)), int(star.size))
+        self.star_x -= self.star_speed
+        wrap = self.star_x < 0
+        n_wrap = np.count_nonzero(wrap)
+        if n_wrap:
+            self.star_x[wrap] = WIDTH
+            self.star_y[wrap] = self.next_star_ys(n_wrap)
+        self.draw_stars(self.screen)
+
+    def next_star_ys(self, count: int) -> np.ndarray:
+        """ Takes `count` random star heights from a prefilled pool, refilling it when used up """
+        if self.star_y_cursor + count > len(self.star_y_pool):
+            self.star_y_pool = np.random.randint(0, HEIGHT + 1, STAR_POOL_SIZE)
+            self.star_y_cursor = 0
+        ys = self.star_y_pool[self.star_y_cursor:self.star_y_cursor + count]
+        self.star_y_cursor += count
+        return ys
+
+    def draw_stars(self, surface: pygame.Surface):
+        sprites = self.star_sprites
+        xs = (self.star_x.astype(np.int32) - self.star_size).tolist()
+        ys = (self.star_y.astype(np.int32) - self.star_size).tolist()
+        blit_list = [(sprites[r], (x, y)) for r, x, y in zip(self.star_size.tolist(), xs, ys)]
+        surface.blits(blit_list, doreturn=0)
+
+    def render_starfield(self) -> pygame.Surface:
+        """ Bakes the sky and the current stars into one surface, for scenes where the stars stand still """
+        surf = pygame.Surface((WIDTH, HEIGHT)).convert()
+        surf.fill(COLOR_BG)
+        self.draw_stars(surf)
+        return surf
+
+    def draw_powerups(self):
+        # Power-ups are pure pygame.draw calls, so hold one lock for the whole
+        # sweep instead of one per polygon (blits are not allowed while locked)
+        self.screen.lock()
+        for pu in self.powerups:
+            pu.draw(self.screen)
+        self.screen.unlock()
+
+    def draw_clouds(self, is_ghost_active: bool):
+        n = self.n_clouds
+        xs = self.cloud_x[:n].astype(np.int32).tolist()
+        ys = self.cloud_y[:n].astype(np.int32).tolist()
+        blit_list = []
+        for cloud, x, y in zip(self.clouds, xs, ys):
+            blit_list.extend(cloud.get_blits(is_ghost_active, x, y))
+        self.screen.blits(blit_list, doreturn=0)
+
+    def render_moon(self) -> pygame.Surface:
+        """ Pre-renders the HUD moon with the target number on it """
+        surf = pygame.Surface((100, 100), pygame.SRCALPHA).convert_alpha()
+        mx, my = 50, 50
+        pygame.draw.circle(surf, COLOR_MOON, (mx, my), 50)
+        pygame.draw.circle(surf, (200, 200, 180), (mx-15, my-10), 10)
+        t_surf = self.font_ui.render(str(self.target), True, (50, 50, 50))
+        surf.blit(t_surf, (mx - t_surf.get_width()//2, my - t_surf.get_height()//2))
+        return surf
 
     def draw_hud(self):
         if self.state == GameState.PLAYING:
-            mx, my = WIDTH - 80, 80
-            pygame.draw.circle(self.screen, COLOR_MOON, (mx, my), 50)
-            pygame.draw.circle(self.screen, (200, 200, 180), (mx-15, my-10), 10)
-            t_surf = self.font_ui.render(str(self.target), True, (50, 50, 50))
-            self.screen.blit(t_surf, (mx - t_surf.get_width()//2, my - t_surf.get_height()//2))
+            self.screen.blit(self.moon_surf, (WIDTH - 130, 30))
 
         y_hud = 20
-        status_texts = []
-        if self.timer_slow_motion > 0: status_texts.append(("SLOW MOTION", COLOR_PU_SLOW))
-        if self.timer_ghost_mode > 0: status_texts.append(("GHOST MODE", COLOR_PU_GHOST))
-        if self.timer_inverted > 0: status_texts.append(("CONTROLS FLIPPED!", (255, 100, 255)))
-        if self.timer_rapid_fire > 0: status_texts.append(("RAPID FIRE!!!", COLOR_PU_RAPID))
+        status_keys = []
+        if self.timer_slow_motion > 0: status_keys.append("slow")
+        if self.timer_ghost_mode > 0: status_keys.append("ghost")
+        if self.timer_inverted > 0: status_keys.append("inverted")
+        if self.timer_rapid_fire > 0: status_keys.append("rapid")
         
-        for text, color in status_texts:
-            surf = self.font_ui.render(text, True, color)
-            self.screen.blit(surf, (20, y_hud))
+        for key in status_keys:
+            self.screen.blit(self.hud_banners[key], (20, y_hud))
             y_hud += 30
 
         if self.current_difficulty_speed > BASE_SCROLL_SPEED and self.timer_rapid_fire == 0:
-            spd_text = self.font_ui.render("DECIMAL PENALTY! SPEED UP!", True, (255, 50, 50))
-            self.screen.blit(spd_text, (20, y_hud))
+            self.screen.blit(self.hud_banners["penalty"], (20, y_hud))
 
     def animate_landing_scene(self):
         moon_rect = pygame.Rect(0, HEIGHT - 200, WIDTH, 200)
@@ -373,7 +530,14 @@ class SpaceMathGame:
             # 2. Get Keys (Called every frame, ensuring immediate response)
             keys = pygame.key.get_pressed()
 
-            self.screen.fill(COLOR_BG)
+            # The stars only scroll with parallax outside the landing scene, so only
+            # the landing scene can reuse a pre-rendered starfield
+            if self.state == GameState.LANDING_SCENE:
+                if self.stars_bg_surf is None:
+                    self.stars_bg_surf = self.render_starfield()
+                self.screen.blit(self.stars_bg_surf, (0, 0))
+            else:
+                self.screen.fill(COLOR_BG)
             
             if self.state == GameState.PLAYING:
                 self.update_background()
@@ -418,9 +582,11 @@ class SpaceMathGame:
                     self.timer_spawn_powerup = 0
                 
                 # --- COLLISIONS ---
-                for pu in self.powerups[:]:
+                # Survivors are collected into the spare list, which is then swapped in
+                kept_powerups = self.powerups_spare
+                kept_powerups.clear()
+                for pu in self.powerups:
                     pu.move(effective_speed)
-                    pu.draw(self.screen)
                     if self.player.rect.colliderect(pu.rect):
                         if pu.type == PowerUpType.SLOW_MOTION:
                             self.timer_slow_motion = 600
@@ -432,30 +598,38 @@ class SpaceMathGame:
                             self.timer_inverted = 300 
                         elif pu.type == PowerUpType.RAPID_FIRE:
                             self.timer_rapid_fire = 300 
-                        self.powerups.remove(pu)
-                    elif pu.rect.right < 0:
-                        self.powerups.remove(pu)
-
-                for cloud in self.clouds[:]:
-                    cloud.move(effective_speed)
-                    cloud.draw(self.screen, self.font_cloud, self.timer_ghost_mode > 0)
-                    
-                    if self.player.rect.colliderect(cloud.rect):
-                        if self.timer_ghost_mode > 0:
-                            pass 
-                        else:
-                            penalty = self.player.calculate(cloud.op, cloud.val)
-                            if penalty and self.timer_rapid_fire == 0:
-                                self.current_difficulty_speed *= 1.2
-                                if self.current_difficulty_speed > 18: self.current_difficulty_speed = 18
-                            
-                            self.clouds.remove(cloud)
-                            if self.player.score == self.target:
-                                self.state = GameState.TRANSITION_TO_LANDING
-                    
-                    if cloud.rect.right < 0:
-                        self.clouds.remove(cloud)
-
+                        continue
+                    if pu.rect.right >= 0:
+                        kept_powerups.append(pu)
+                self.powerups_spare, self.powerups = self.powerups, kept_powerups
+
+                wave_phase = pygame.time.get_ticks() * 0.002
+                self.move_clouds(effective_speed, wave_phase)
+
+                # Bounding box test against every cloud at once
+                n = self.n_clouds
+                cx, cy = self.cloud_x[:n], self.cloud_y[:n]
+                keep = cx + CLOUD_WIDTH >= 0
+                if self.timer_ghost_mode == 0:
+                    p = self.player.rect
+                    hits = (cx < p.right) & (cx + CLOUD_WIDTH > p.left) & (cy < p.bottom) & (cy + CLOUD_HEIGHT > p.top)
+                    for i in np.flatnonzero(hits).tolist():
+                        cloud = self.clouds[i]
+                        penalty = self.player.calculate(cloud.op, cloud.val)
+                        if penalty and self.timer_rapid_fire == 0:
+                            self.current_difficulty_speed *= 1.2
+                            if self.current_difficulty_speed > 18: self.current_difficulty_speed = 18
+                        
+                        if self.player.score == self.target:
+                            self.state = GameState.TRANSITION_TO_LANDING
+                    keep &= ~hits
+
+                if not keep.all():
+                    self.keep_clouds(keep)
+
+                # --- DRAW ---
+                self.draw_powerups()
+                self.draw_clouds(self.timer_ghost_mode > 0)
                 self.player.draw_spaceship(self.screen, self.font_ui, is_ghost=self.timer_ghost_mode > 0)
                 self.draw_hud()
 
@@ -467,17 +641,13 @@ class SpaceMathGame:
                     self.state = GameState.LANDING_SCENE
                     
             elif self.state == GameState.LANDING_SCENE:
-                for star in self.stars:
-                     pygame.draw.circle(self.screen, (255, 255, 255), (int(star.x), int(star.y)), int(star.size))
                 self.animate_landing_scene()
 
             elif self.state == GameState.GAME_OVER:
                 self.update_background()
-                for c in self.clouds: c.draw(self.screen, self.font_cloud, False)
+                self.draw_clouds(False)
                 self.player.draw_spaceship(self.screen, self.font_ui)
-                overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 180))
-                self.screen.blit(overlay, (0,0))
+                self.screen.blit(self.game_over_overlay, (0,0))
                 txt = self.font_big.render("GAME OVER", True, (255, 50, 50))
                 self.screen.blit(txt, (WIDTH//2 - txt.get_width()//2, HEIGHT//2 - 50))
 